@@ -1,8 +1,8 @@
 import json
 import logging
 import queue
-import threading
 from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import Any
 
 from fastapi import FastAPI, Request
@@ -31,8 +31,13 @@ gemini = _components.gemini
 
 # --- SSE streaming helper ---
 
+# Streamed jobs (batch generation, statement parsing, ...) run here rather than
+# on a fresh thread each, so a burst of requests queues instead of piling up threads.
+_stream_executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix="sse")
+
+
 def _sse_stream(work_fn: Callable[[ProgressEmitter], Any]) -> StreamingResponse:
-    """Run work_fn in a thread, streaming progress events via SSE."""
+    """Run work_fn on the stream executor, streaming progress events via SSE."""
     event_queue: queue.Queue[ProgressEvent | None] = queue.Queue()
     emitter = ProgressEmitter(_on_event=event_queue.put)
     result_holder: list[Any] = []
@@ -46,19 +51,18 @@ def _sse_stream(work_fn: Callable[[ProgressEmitter], Any]) -> StreamingResponse:
         finally:
             event_queue.put(None)
 
-    thread = threading.Thread(target=_run)
-    thread.start()
-    return StreamingResponse(_generate(event_queue, thread, result_holder, error_holder), media_type="text/event-stream")
+    future = _stream_executor.submit(_run)
+    return StreamingResponse(_generate(event_queue, future, result_holder, error_holder), media_type="text/event-stream")
 
 
-def _generate(event_queue, thread, result_holder, error_holder):
+def _generate(event_queue, future: Future, result_holder, error_holder):
     while True:
         event = event_queue.get()
         if event is None:
             break
         data = json.dumps({"stage": event.stage, "detail": event.detail}, ensure_ascii=False)
         yield f"event: progress\ndata: {data}\n\n"
-    thread.join()
+    future.result()
     if error_holder:
         data = json.dumps({"result": None, "error": error_holder[0]}, ensure_ascii=False)
     else:
@@ -3,11 +3,14 @@
 from __future__ import annotations
 
 import csv
+import io
 import logging
 import re
+from collections.abc import Iterable, Iterator
 from datetime import datetime
 from decimal import Decimal, InvalidOperation
 from pathlib import Path
+from typing import IO
 
 from backend.config import (
     DEFAULT_ENTITY,
@@ -27,6 +30,9 @@ logger = logging.getLogger(__name__)
 _TO_PATTERN = re.compile(r"^To (.+)$", re.IGNORECASE)
 _FROM_PATTERN = re.compile(r"^From (.+)$", re.IGNORECASE)
 
+# Statements are read in one or two syscalls instead of 8 KiB at a time
+_READ_BUFFER = 1 << 20
+
 
 class ParseBankStatement:
     """Orchestrates CSV parsing, categorization, and optional Airtable upload."""
@@ -47,9 +53,14 @@ class ParseBankStatement:
         Returns:
             List of AirtableExpense records.
         """
-        filepath = Path(filepath)
-        rows = _read_csv(filepath)
-        expenses = _categorize_transactions(rows, aed_to_rub)
+        with Path(filepath).open("rb", buffering=_READ_BUFFER) as f:
+            return self.execute_stream(f, aed_to_rub, upload=upload)
+
+    def execute_stream(
+        self, fileobj: IO[bytes], aed_to_rub: float, *, upload: bool = False,
+    ) -> list[AirtableExpense]:
+        """Same as execute(), reading the CSV from an open binary file object."""
+        expenses = _categorize_transactions(_iter_csv(fileobj), aed_to_rub)
 
         if upload:
             self._airtable.upload_expenses(expenses)
@@ -57,10 +68,13 @@ class ParseBankStatement:
         return expenses
 
 
-def _read_csv(filepath: Path) -> list[dict[str, str]]:
-    with open(filepath, encoding="utf-8") as f:
-        reader = csv.DictReader(f)
-        return list(reader)
+def _iter_csv(fileobj: IO[bytes]) -> Iterator[dict[str, str]]:
+    """Yield statement rows one at a time; rows are categorized as they are read."""
+    text = io.TextIOWrapper(fileobj, encoding="utf-8", newline="")
+    try:
+        yield from csv.DictReader(text)
+    finally:
+        text.detach()  # leave the caller's file object open
 
 
 def _to_rub(aed_amount: Decimal, rate: float) -> float:
@@ -282,7 +296,7 @@ def _parse_row(row: dict[str, str]) -> tuple[str, str, Decimal, str] | None:
         return None
 
 
-def _categorize_transactions(rows: list[dict[str, str]], aed_to_rub: float) -> list[AirtableExpense]:
+def _categorize_transactions(rows: Iterable[dict[str, str]], aed_to_rub: float) -> list[AirtableExpense]:
     expenses, swift_fees, fx_fees = [], [], []
     for row in rows:
         parsed = _parse_row(row)
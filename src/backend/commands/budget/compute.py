@@ -16,6 +16,7 @@ from backend.infrastructure.repositories.sheets.budget_repo import (
     write_pnl_section,
 )
 from backend.infrastructure.repositories.sheets.contractor_repo import (
+    contractors_by_id,
     find_contractor,
     find_contractor_by_id,
     load_all_contractors,
@@ -319,10 +320,11 @@ class ComputeBudget:
         groups: dict[str, list[PaymentEntry]],
         seen_ids: set[str],
     ) -> None:
+        by_id = contractors_by_id(contractors)
         for fr in flat_rate_rules:
             if not fr.contractor_id or fr.contractor_id in seen_ids:
                 continue
-            c = find_contractor_by_id(fr.contractor_id, contractors)
+            c = by_id.get(fr.contractor_id)
             if c is None:
                 logger.warning("Flat-rate contractor not found: %s", fr.contractor_id)
                 continue
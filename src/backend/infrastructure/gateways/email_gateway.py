@@ -18,6 +18,9 @@ from backend.models import IncomingEmail
 
 logger = logging.getLogger(__name__)
 
+# Gmail caps batch requests at 100 calls and recommends staying at or below 50
+_BATCH_SIZE = 50
+
 
 class EmailGateway:
     """Wraps Gmail API for the support inbox."""
@@ -41,16 +44,41 @@ class EmailGateway:
         message_ids = [m["id"] for m in resp.get("messages", [])]
         logger.info("Gmail poll: %d recent unread messages", len(message_ids))
 
+        raw_by_id = self._fetch_raw(gmail, message_ids)
         emails = []
         for msg_id in message_ids:
-            raw_resp = gmail.users().messages().get(
-                userId="me", id=msg_id, format="raw"
-            ).execute()
-            raw_bytes = base64.urlsafe_b64decode(raw_resp["raw"])
+            if msg_id not in raw_by_id:
+                continue
+            raw_bytes = base64.urlsafe_b64decode(raw_by_id[msg_id])
             msg = email.message_from_bytes(raw_bytes)
             emails.append(parse_email_message(msg_id, msg))
         return emails
 
+    @staticmethod
+    def _fetch_raw(gmail, message_ids: list[str]) -> dict[str, str]:
+        """Fetch raw message bodies in batched HTTP requests instead of one call each.
+
+        Messages that fail to fetch are skipped; they stay unread and are
+        picked up on the next poll.
+        """
+        raw_by_id: dict[str, str] = {}
+
+        def _collect(request_id, response, exception):
+            if exception is not None:
+                logger.warning("Gmail fetch failed for %s: %s", request_id, exception)
+            else:
+                raw_by_id[request_id] = response["raw"]
+
+        for i in range(0, len(message_ids), _BATCH_SIZE):
+            batch = gmail.new_batch_http_request(callback=_collect)
+            for msg_id in message_ids[i:i + _BATCH_SIZE]:
+                batch.add(
+                    gmail.users().messages().get(userId="me", id=msg_id, format="raw"),
+                    request_id=msg_id,
+                )
+            batch.execute()
+        return raw_by_id
+
     def mark_read(self, uid: str) -> None:
         """Remove UNREAD label from a message."""
         self._gmail().users().messages().modify(
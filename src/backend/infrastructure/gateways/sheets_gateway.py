@@ -46,6 +46,25 @@ class SheetsGateway:
             .execute()
         )
 
+    def batch_write(
+        self,
+        spreadsheet_id: str,
+        data: list[tuple[str, list[list[Any]]]],
+        value_input_option: str = "USER_ENTERED",
+    ) -> dict:
+        """Write several (range, values) pairs in a single request."""
+        body = {
+            "valueInputOption": value_input_option,
+            "data": [{"range": r, "values": v} for r, v in data],
+        }
+        return (
+            self._service()
+            .spreadsheets()
+            .values()
+            .batchUpdate(spreadsheetId=spreadsheet_id, body=body)
+            .execute()
+        )
+
     def append(
         self,
         spreadsheet_id: str,
@@ -4,6 +4,8 @@ from __future__ import annotations
 
 import logging
 import random
+import threading
+import time
 from difflib import SequenceMatcher
 
 from pydantic import ValidationError
@@ -117,8 +119,8 @@ def _parse_stub(row: dict[str, str]) -> StubContractor | None:
         return None
 
 
-def load_all_contractors() -> list[Contractor]:
-    """Load all contractors from all typed sheets + stub sheet."""
+def _read_all_contractors() -> list[Contractor]:
+    """Read all contractors from all typed sheets + stub sheet."""
     contractors: list[Contractor] = []
     for sheet_name, (ctype, _currency) in SHEET_CONFIG.items():
         rows = _sheets.read_as_dicts(CONTRACTORS_SHEET_ID, _sheet_range(sheet_name))
@@ -136,6 +138,59 @@ def load_all_contractors() -> list[Contractor]:
     return contractors
 
 
+# Last full read of the sheets. Kept warm by the backend's refresh loop
+# (run.py) and dropped on every write below, so readers never see stale rows
+# for longer than one refresh. The TTL bounds staleness when no loop runs
+# (scripts, a crashed loop). _generation guards against a slow refresh
+# storing rows that were read before a concurrent write.
+_SNAPSHOT_TTL = 60.0
+_snapshot: list[Contractor] | None = None
+_snapshot_expires = 0.0
+_generation = 0
+_snapshot_lock = threading.Lock()
+_refresh_lock = threading.Lock()
+
+
+def _fresh_snapshot() -> list[Contractor] | None:
+    snapshot = _snapshot
+    if snapshot is not None and time.monotonic() < _snapshot_expires:
+        return snapshot
+    return None
+
+
+def refresh_contractors() -> list[Contractor]:
+    """Re-read all contractor sheets and replace the cached snapshot."""
+    global _snapshot, _snapshot_expires  # noqa: PLW0603 — module-level cache
+    with _snapshot_lock:
+        generation = _generation
+    contractors = _read_all_contractors()
+    with _snapshot_lock:
+        if generation == _generation:
+            _snapshot = contractors
+            _snapshot_expires = time.monotonic() + _SNAPSHOT_TTL
+    return contractors
+
+
+def invalidate_contractors() -> None:
+    """Drop the cached snapshot; the next load re-reads the sheets."""
+    global _snapshot, _generation  # noqa: PLW0603 — module-level cache
+    with _snapshot_lock:
+        _snapshot = None
+        _generation += 1
+
+
+def load_all_contractors() -> list[Contractor]:
+    """Load all contractors, served from the cached snapshot when warm."""
+    snapshot = _fresh_snapshot()
+    if snapshot is None:
+        # Concurrent cold readers share one sheet read instead of each doing their own
+        with _refresh_lock:
+            snapshot = _fresh_snapshot()
+            if snapshot is None:
+                snapshot = refresh_contractors()
+    return list(snapshot)
+
+
 def _similarity(a: str, b: str) -> float:
     """Case-insensitive similarity ratio between two strings."""
     return SequenceMatcher(None, a.lower().strip(), b.lower().strip()).ratio()
@@ -191,6 +246,14 @@ def find_contractor_by_id(contractor_id: str, contractors: list[Contractor]) ->
     return None
 
 
+def contractors_by_id(contractors: list[Contractor]) -> dict[str, Contractor]:
+    """Index contractors by ID for repeated lookups; first match wins, as in find_contractor_by_id."""
+    by_id: dict[str, Contractor] = {}
+    for c in contractors:
+        by_id.setdefault(c.id, c)
+    return by_id
+
+
 def find_contractor(query: str, contractors: list[Contractor]) -> Contractor | None:
     """Find the single best matching contractor, or None."""
     matches = fuzzy_find(query, contractors)
@@ -253,6 +316,7 @@ def bind_telegram_id(contractor_id: str, telegram_id: int) -> None:
     sheet_name, rows, row_idx = result
     headers = [h.strip().lower() for h in rows[0]]
     if _write_cell(sheet_name, headers, row_idx, "telegram", str(telegram_id)):
+        invalidate_contractors()
         logger.info("Bound telegram_id %s to contractor %s", telegram_id, contractor_id)
 
 
@@ -274,12 +338,14 @@ def save_contractor(c: Contractor) -> None:
     """Append a new contractor to the correct sheet based on type."""
     sheet_name = SHEET_NAME_BY_TYPE[c.type]
     _sheets.append(CONTRACTORS_SHEET_ID, _sheet_range(sheet_name), [contractor_to_row(c)])
+    invalidate_contractors()
     logger.info("Saved contractor %s (%s) to sheet '%s'", c.id, c.display_name, sheet_name)
 
 
 def save_stub(c: StubContractor) -> None:
     """Append a stub contractor to the stub sheet."""
     _sheets.append(CONTRACTORS_SHEET_ID, _sheet_range(STUB_SHEET), [contractor_to_row(c)])
+    invalidate_contractors()
     logger.info("Saved stub %s (%s) to sheet '%s'", c.id, c.display_name, STUB_SHEET)
 
 
@@ -293,6 +359,7 @@ def delete_contractor_from_sheet(contractor_id: str) -> bool:
         for idx, row in enumerate(rows[1:], start=1):
             if len(row) > 0 and row[0] == contractor_id:
                 _sheets.delete_row(CONTRACTORS_SHEET_ID, sheet_name, idx)
+                invalidate_contractors()
                 logger.info("Deleted contractor %s from sheet '%s'", contractor_id, sheet_name)
                 return True
     return False
@@ -325,6 +392,7 @@ def increment_invoice_number(contractor_id: str) -> int:
     headers = [h.strip().lower() for h in rows[0]]
     new_num = _read_current_invoice_number(rows, headers, row_idx) + 1
     _write_cell(sheet_name, headers, row_idx, "invoice_number", str(new_num))
+    invalidate_contractors()
     logger.info("Updated %s invoice_number to %d", contractor_id, new_num)
     return new_num
 
@@ -386,5 +454,6 @@ def update_contractor_fields(contractor_id: str, updates: dict[str, str]) -> int
     sheet_name, rows, row_idx = result
     headers = [h.strip().lower() for h in rows[0]]
     count = sum(1 for f, v in updates.items() if _write_cell(sheet_name, headers, row_idx, f, v))
+    invalidate_contractors()
     logger.info("Updated %d fields for contractor %s", count, contractor_id)
     return count
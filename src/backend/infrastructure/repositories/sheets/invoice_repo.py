@@ -92,8 +92,8 @@ def save_invoice(invoice: Invoice) -> None:
     logger.info("Saved invoice for %s (%s)", invoice.contractor_id, invoice.month)
 
 
-def _find_invoice_row(contractor_id: str, month: str) -> tuple[list[str], int] | None:
-    """Find invoice row by contractor_id + month. Returns (headers, row_index) or None."""
+def _index_invoice_rows() -> tuple[list[str], dict[tuple[str, str], int]] | None:
+    """Read the sheet once. Returns (headers, {(contractor_id, month): row_index}) or None."""
     rows = _sheets.read(CONTRACTORS_SHEET_ID, SHEET_RANGE)
     if not rows:
         return None
@@ -104,22 +104,42 @@ def _find_invoice_row(contractor_id: str, month: str) -> tuple[list[str], int] |
     except ValueError:
         logger.error("Required columns not found in invoices sheet")
         return None
+    row_by_key: dict[tuple[str, str], int] = {}
     for idx, row in enumerate(rows[1:], start=1):
         padded = row + [""] * (len(headers) - len(row))
-        if padded[cid_col] == contractor_id and padded[month_col] == month:
-            return headers, idx
-    return None
+        row_by_key.setdefault((padded[cid_col], padded[month_col]), idx)  # first match wins
+    return headers, row_by_key
 
 
-def _write_invoice_field(headers: list[str], row_idx: int, field: str, value: str) -> bool:
-    """Find column by name and write value to the invoice row. Returns True on success."""
+def _find_invoice_row(contractor_id: str, month: str) -> tuple[list[str], int] | None:
+    """Find invoice row by contractor_id + month. Returns (headers, row_index) or None."""
+    indexed = _index_invoice_rows()
+    if indexed is None:
+        return None
+    headers, row_by_key = indexed
+    row_idx = row_by_key.get((contractor_id, month))
+    return None if row_idx is None else (headers, row_idx)
+
+
+def _field_column(headers: list[str], field: str) -> str | None:
+    """Column letter for the named field, or None if the sheet lacks it."""
     try:
-        col_idx = headers.index(field)
+        return index_to_column_letter(headers.index(field))
     except ValueError:
         logger.error("Column %s not found in invoices sheet", field)
+        return None
+
+
+def _cell_range(col_letter: str, row_idx: int) -> str:
+    return f"'{SHEET_NAME}'!{col_letter}{row_idx + 1}"
+
+
+def _write_invoice_field(headers: list[str], row_idx: int, field: str, value: str) -> bool:
+    """Find column by name and write value to the invoice row. Returns True on success."""
+    col_letter = _field_column(headers, field)
+    if col_letter is None:
         return False
-    col_letter = index_to_column_letter(col_idx)
-    _sheets.write(CONTRACTORS_SHEET_ID, f"'{SHEET_NAME}'!{col_letter}{row_idx + 1}", [[value]])
+    _sheets.write(CONTRACTORS_SHEET_ID, _cell_range(col_letter, row_idx), [[value]])
     return True
 
 
@@ -144,6 +164,30 @@ def update_invoice_status(contractor_id: str, month: str, status: InvoiceStatus)
     logger.info("Updated invoice status for %s/%s to %s", contractor_id, month, status.value)
 
 
+def update_invoice_statuses(updates: list[tuple[str, str, InvoiceStatus]]) -> None:
+    """Set status for many (contractor_id, month) invoices: one sheet read, one batch write."""
+    if not updates:
+        return
+    indexed = _index_invoice_rows()
+    if indexed is None:
+        logger.warning("Invoices sheet is empty or malformed, %d status updates dropped", len(updates))
+        return
+    headers, row_by_key = indexed
+    status_col = _field_column(headers, "status")
+    if status_col is None:
+        return
+    data = []
+    for contractor_id, month, status in updates:
+        row_idx = row_by_key.get((contractor_id, month))
+        if row_idx is None:
+            logger.warning("Invoice not found for %s/%s", contractor_id, month)
+            continue
+        data.append((_cell_range(status_col, row_idx), [[status.value]]))
+    if data:
+        _sheets.batch_write(CONTRACTORS_SHEET_ID, data)
+    logger.info("Updated invoice status for %d/%d invoices", len(data), len(updates))
+
+
 def update_receipt_url(contractor_id: str, month: str, url: str) -> None:
     result = _find_invoice_row(contractor_id, month)
     if result is None:
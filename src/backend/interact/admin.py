@@ -1,9 +1,9 @@
 """Admin interaction handlers."""
 
 import base64
+import io
 import logging
-import os
-import tempfile
+import re
 from decimal import Decimal
 
 from backend.commands.invoice.generate import GenerateInvoice
@@ -13,6 +13,7 @@ from backend.infrastructure.gateways.docs_gateway import DocsGateway
 from backend.infrastructure.gateways.republic_gateway import RepublicGateway
 from backend.infrastructure.repositories.sheets.budget_repo import load_all_amounts
 from backend.infrastructure.repositories.sheets.contractor_repo import (
+    contractors_by_id,
     find_contractor,
     find_contractor_by_id,
     fuzzy_find,
@@ -20,7 +21,7 @@ from backend.infrastructure.repositories.sheets.contractor_repo import (
 )
 from backend.infrastructure.repositories.sheets.invoice_repo import (
     load_invoices,
-    update_invoice_status,
+    update_invoice_statuses,
     update_legium_link,
 )
 from backend.interact.helpers import (
@@ -46,6 +47,11 @@ from backend.wiring import create_generate_batch_invoices, create_parse_bank_sta
 
 logger = logging.getLogger(__name__)
 
+# "/generate debug <name>" — debug prefix before the contractor name
+_DEBUG_PREFIX = re.compile(r"^\s*debug\s+", re.IGNORECASE)
+# "/generate_invoices debug" etc. — standalone debug word anywhere in args
+_DEBUG_FLAG = re.compile(r"(?<!\S)debug(?!\S)", re.IGNORECASE)
+
 
 def _activate_next_task(db, completed_task: dict) -> None:
     """Find and activate the next task in chain after a checkpoint."""
@@ -96,8 +102,9 @@ class AdminHandlers:
         text = payload.get("text", "").strip()
         if not text:
             return respond([msg("Использование: /generate <имя контрагента>")])
-        debug = text.lower().startswith("debug ")
-        query = text[6:].strip() if debug else text
+        m = _DEBUG_PREFIX.match(text)
+        debug = bool(m)
+        query = text[m.end():] if m else text
         contractor, err = self._find_or_suggest(query)
         if not contractor:
             return respond([err])
@@ -124,7 +131,7 @@ class AdminHandlers:
 
     def batch_generate(self, payload: Payload, ctx: InteractContext) -> dict:
         progress = ctx.get("progress")
-        debug = "debug" in payload.get("text", "").lower().split()
+        debug = bool(_DEBUG_FLAG.search(payload.get("text", "")))
         month = prev_month()
         if progress:
             progress.emit("batch_start", f"Запускаю генерацию за {month}")
@@ -134,7 +141,7 @@ class AdminHandlers:
         return self._format_batch(batch_result, month, debug)
 
     def send_global(self, payload: Payload, _ctx: InteractContext) -> dict:
-        debug = "debug" in payload.get("text", "").lower().split()
+        debug = bool(_DEBUG_FLAG.search(payload.get("text", "")))
         month = prev_month()
         invoices = load_invoices(month)
         drafts = [inv for inv in invoices if inv.status == InvoiceStatus.DRAFT and inv.currency == Currency.EUR]
@@ -143,7 +150,7 @@ class AdminHandlers:
         return self._send_global_batch(drafts, month, debug)
 
     def send_legium(self, payload: Payload, _ctx: InteractContext) -> dict:
-        debug = "debug" in payload.get("text", "").lower().split()
+        debug = bool(_DEBUG_FLAG.search(payload.get("text", "")))
         month = prev_month()
         invoices = load_invoices(month)
         pending = [inv for inv in invoices if inv.legium_link and inv.status == InvoiceStatus.DRAFT]
@@ -175,12 +182,12 @@ class AdminHandlers:
     def remind_receipts(self, _payload: Payload, _ctx: InteractContext) -> dict:
         month = prev_month()
         invoices = load_invoices(month)
-        contractors = load_all_contractors()
+        by_id = contractors_by_id(load_all_contractors())
         missing = []
         for inv in invoices:
             if inv.receipt_url or inv.currency != Currency.RUB:
                 continue
-            c = find_contractor_by_id(inv.contractor_id, contractors)
+            c = by_id.get(inv.contractor_id)
             if not c or c.type != ContractorType.SAMOZANYATY:
                 continue
             if inv.status not in (InvoiceStatus.SENT, InvoiceStatus.SIGNED, InvoiceStatus.PAID):
@@ -373,18 +380,19 @@ class AdminHandlers:
         return None
 
     def _send_global_batch(self, drafts, month, debug):
-        contractors = load_all_contractors()
-        messages, sides, errors, sent = [], [], [], 0
+        by_id = contractors_by_id(load_all_contractors())
+        messages, sides, errors, sent = [], [], [], []
         for inv in drafts:
-            contractor = find_contractor_by_id(inv.contractor_id, contractors)
-            err = self._send_one_global(inv, contractor, month, debug, messages, sides)
+            contractor = by_id.get(inv.contractor_id)
+            err = self._send_one_global(inv, contractor, debug, messages, sides)
             if err:
                 errors.append(err)
             else:
-                sent += 1
-        return self._summary_response("глобальных счетов", sent, month, debug, errors, messages, sides)
+                sent.append((inv.contractor_id, month, InvoiceStatus.SENT))
+        update_invoice_statuses(sent)
+        return self._summary_response("глобальных счетов", len(sent), month, debug, errors, messages, sides)
 
-    def _send_one_global(self, inv, contractor, month, debug, messages, sides):  # noqa: PLR0913
+    def _send_one_global(self, inv, contractor, debug, messages, sides):
         if not contractor:
             return f"{inv.contractor_id}: контрагент не найден"
         if not inv.doc_id:
@@ -393,9 +401,9 @@ class AdminHandlers:
             pdf_bytes = DocsGateway().export_pdf(inv.doc_id)
         except Exception as e:
             return f"{contractor.display_name}: ошибка экспорта PDF ({e})"
-        return self._deliver_global(contractor, pdf_bytes, month, debug, messages, sides)
+        return self._deliver_global(contractor, pdf_bytes, debug, messages, sides)
 
-    def _deliver_global(self, contractor, pdf_bytes, month, debug, messages, sides):  # noqa: PLR0913
+    def _deliver_global(self, contractor, pdf_bytes, debug, messages, sides):
         filename = f"{contractor.display_name}+Unsigned.pdf"
         if debug:
             tg_info = f"tg: {contractor.telegram}" if contractor.telegram else "tg id not found"
@@ -405,20 +413,20 @@ class AdminHandlers:
         else:
             sides.append(side_msg(int(contractor.telegram), file=(pdf_bytes, filename),
                                   text="Ваша проформа. Пожалуйста, подпишите и отправьте обратно в этот чат."))
-        update_invoice_status(contractor.id, month, InvoiceStatus.SENT)
         return None
 
     def _send_legium_batch(self, pending, month, debug):
-        contractors = load_all_contractors()
-        messages, sides, errors, sent = [], [], [], 0
+        by_id = contractors_by_id(load_all_contractors())
+        messages, sides, errors, sent = [], [], [], []
         for inv in pending:
-            contractor = find_contractor_by_id(inv.contractor_id, contractors)
+            contractor = by_id.get(inv.contractor_id)
             err = self._send_one_legium(inv, contractor, month, debug, messages, sides)
             if err:
                 errors.append(err)
             else:
-                sent += 1
-        return self._summary_response("ссылок на Легиум", sent, month, debug, errors, messages, sides)
+                sent.append((inv.contractor_id, month, InvoiceStatus.SENT))
+        update_invoice_statuses(sent)
+        return self._summary_response("ссылок на Легиум", len(sent), month, debug, errors, messages, sides)
 
     def _send_one_legium(self, inv, contractor, month, debug, messages, sides):  # noqa: PLR0913
         if not contractor:
@@ -430,7 +438,6 @@ class AdminHandlers:
             return f"{contractor.display_name}: не привязан к Telegram"
         else:
             self._send_legium_to_contractor(contractor, inv, month, sides)
-        update_invoice_status(inv.contractor_id, month, InvoiceStatus.SENT)
         return None
 
     def _send_legium_to_contractor(self, contractor, inv, month, sides):
@@ -448,22 +455,13 @@ class AdminHandlers:
                            "/upload_to_airtable <курс AED→RUB>")])
 
     def _process_statement(self, file_bytes, rate, progress):
-        tmp_path = self._write_temp_csv(file_bytes)
-        try:
-            if progress:
-                progress.emit("parse_statement", "Обрабатываю выписку")
-            return self._run_statement_upload(tmp_path, rate)
-        finally:
-            os.unlink(tmp_path)
-
-    def _write_temp_csv(self, file_bytes):
-        with tempfile.NamedTemporaryFile(suffix=".csv", delete=False) as tmp:
-            tmp.write(file_bytes)
-            return tmp.name
+        if progress:
+            progress.emit("parse_statement", "Обрабатываю выписку")
+        return self._run_statement_upload(io.BytesIO(file_bytes), rate)
 
-    def _run_statement_upload(self, tmp_path, rate):
+    def _run_statement_upload(self, csv_file, rate):
         try:
-            expenses = create_parse_bank_statement().execute(tmp_path, rate, upload=True)
+            expenses = create_parse_bank_statement().execute_stream(csv_file, rate, upload=True)
         except Exception as e:
             logger.exception("Airtable upload failed")
             return respond([msg(f"Ошибка загрузки: {e}")])
@@ -38,6 +38,7 @@ from backend.infrastructure.repositories.sheets.rules_repo import (
 from backend.interact.helpers import (
     InteractContext,
     Payload,
+    encode_file,
     file_msg,
     invoice_admin_data,
     msg,
@@ -59,6 +60,8 @@ from backend.models import ResponseDataType as DT
 
 logger = logging.getLogger(__name__)
 
+_AMOUNT_CLEAN_RE = re.compile(r"[^\d.]")
+
 
 class ContractorHandlers:
 
@@ -160,7 +163,7 @@ class ContractorHandlers:
         if not contractor:
             return respond([msg("Контрагент не найден.")], fsm_state=None)
         code = payload.get("text", "").strip()
-        if code.casefold() == contractor.secret_code.casefold():
+        if code.casefold() == contractor.secret_code_folded:
             return self._bind_contractor(contractor, ctx)
         return self._verification_failed(fsm_data)
 
@@ -437,14 +440,15 @@ class ContractorHandlers:
 
     def _send_rub_draft(self, contractor, inv, month, pdf, filename, admin_ids):  # noqa: PLR0913
         caption = "Ваш счёт-оферта. Скоро пришлю ссылку на Легиум."
+        pdf_b64 = encode_file(pdf)  # same PDF goes to the contractor and every admin
         sides = [side_msg(
             admin_id, data=invoice_admin_data(contractor, month, inv.amount),
-            file=(pdf, filename),
+            file=(pdf, filename), file_b64=pdf_b64,
             track={"type": SideMessageTrackType.ADMIN_REPLY,
                    "contractor_telegram": contractor.telegram or "",
                    "contractor_id": contractor.id},
         ) for admin_id in admin_ids]
-        return respond([file_msg(pdf, filename, caption)], side_messages=sides)
+        return respond([file_msg(pdf, filename, caption, file_b64=pdf_b64)], side_messages=sides)
 
     def _suggest_duplicates(self, matches, query):
         buttons = [[{"text": self._dup_label(c), "data": f"dup:{c.id}"}] for c, _ in matches[:5]]
@@ -604,7 +608,7 @@ class ContractorHandlers:
     def _parse_amount(self, text, default):
         if text.lower() in ("ок", "ok"):
             return Decimal(str(default))
-        cleaned = re.sub(r"[^\d.]", "", text)
+        cleaned = _AMOUNT_CLEAN_RE.sub("", text)
         if not cleaned:
             return respond([msg("Введите сумму числом или напишите «ок» для подтверждения.")])
         try:
@@ -636,10 +640,12 @@ class ContractorHandlers:
         return self._format_rub_invoice(contractor, invoice, month, pdf, filename, messages, admin_ids)
 
     def _format_rub_invoice(self, contractor, invoice, month, pdf, filename, messages, admin_ids):  # noqa: PLR0913
-        messages.append(file_msg(pdf, filename, "Ваш счёт-оферта. Скоро пришлю ссылку на Легиум."))
+        pdf_b64 = encode_file(pdf)  # same PDF goes to the contractor and every admin
+        messages.append(file_msg(pdf, filename, "Ваш счёт-оферта. Скоро пришлю ссылку на Легиум.",
+                                 file_b64=pdf_b64))
         sides = [side_msg(
             admin_id, data=invoice_admin_data(contractor, month, invoice.amount),
-            file=(pdf, filename),
+            file=(pdf, filename), file_b64=pdf_b64,
             track={"type": SideMessageTrackType.ADMIN_REPLY,
                    "contractor_telegram": contractor.telegram or "",
                    "contractor_id": contractor.id},
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import base64
 from datetime import date
+from functools import lru_cache
 from typing import TypedDict
 
 from backend.models import Contractor, ProgressEmitter, RoleCode
@@ -40,7 +41,11 @@ ROLE_LABELS = {
 
 
 def prev_month() -> str:
-    today = date.today()
+    return _month_before(date.today())
+
+
+@lru_cache(maxsize=1)
+def _month_before(today: date) -> str:
     if today.month == 1:
         return f"{today.year - 1}-12"
     return f"{today.year}-{today.month - 1:02d}"
@@ -67,10 +72,15 @@ def msg(text: str = "", *, keyboard: list | None = None, data: dict | None = Non
     return m
 
 
+def encode_file(data: bytes) -> str:
+    return base64.b64encode(data).decode()
+
+
 def file_msg(pdf_bytes: bytes, filename: str, caption: str = "", *,
-             data: dict | None = None) -> dict:
+             data: dict | None = None, file_b64: str | None = None) -> dict:
+    """file_b64: pass a pre-encoded pdf_bytes when the same file goes out several times."""
     m = {
-        "file_b64": base64.b64encode(pdf_bytes).decode(),
+        "file_b64": file_b64 or encode_file(pdf_bytes),
         "filename": filename,
     }
     if caption:
@@ -80,15 +90,16 @@ def file_msg(pdf_bytes: bytes, filename: str, caption: str = "", *,
     return m
 
 
-def side_msg(chat_id: int, *, text: str = "", file: tuple[bytes, str] | None = None,
-             track: dict | None = None, data: dict | None = None) -> dict:
+def side_msg(chat_id: int, *, text: str = "", file: tuple[bytes, str] | None = None,  # noqa: PLR0913
+             track: dict | None = None, data: dict | None = None, file_b64: str | None = None) -> dict:
+    """file_b64: pre-encoded file[0], as in file_msg."""
     sm = {"chat_id": chat_id}
     if text:
         sm["text"] = text
     if data:
         sm["data"] = data
     if file:
-        sm["file_b64"] = base64.b64encode(file[0]).decode()
+        sm["file_b64"] = file_b64 or encode_file(file[0])
         sm["filename"] = file[1]
     if track:
         sm["track"] = track
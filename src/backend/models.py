@@ -7,6 +7,7 @@ from dataclasses import dataclass, field
 from datetime import date
 from decimal import Decimal
 from enum import StrEnum
+from functools import cache, cached_property
 from typing import ClassVar
 
 from pydantic import BaseModel, Field
@@ -104,12 +105,22 @@ class Contractor(BaseModel):
     def is_stub(self) -> bool:
         return False
 
+    @cached_property
+    def secret_code_folded(self) -> str:
+        """Casefolded secret_code for verification; computed once per loaded contractor."""
+        return self.secret_code.casefold()
+
+    # FIELD_META is static per class, so the derived label maps are built once
+    # per subclass and shared. Callers must treat them as read-only.
+
     @classmethod
+    @cache
     def required_fields(cls) -> dict[str, str]:
         """Return {field_name: label} for fields required at registration."""
         return {k: v.label for k, v in cls.FIELD_META.items() if v.required}
 
     @classmethod
+    @cache
     def all_field_labels(cls) -> dict[str, str]:
         """Return {field_name: label} for all user-facing fields."""
         return {k: v.label for k, v in cls.FIELD_META.items()}
@@ -12,6 +12,7 @@ from backend.api import app
 logger = logging.getLogger(__name__)
 
 GOAL_MONITOR_INTERVAL = int(os.getenv("GOAL_MONITOR_INTERVAL", ""))
+CONTRACTORS_REFRESH_INTERVAL = int(os.getenv("CONTRACTORS_REFRESH_INTERVAL", "30"))
 
 
 async def _goal_monitor_loop():
@@ -26,17 +27,30 @@ async def _goal_monitor_loop():
     while True:
         await asyncio.sleep(GOAL_MONITOR_INTERVAL)
         try:
-            result = await asyncio.get_event_loop().run_in_executor(None, monitor.run)
+            result = await asyncio.get_running_loop().run_in_executor(None, monitor.run)
             logger.info("GoalMonitor: %s", result)
         except Exception:
             logger.exception("GoalMonitor failed")
 
 
+async def _contractors_refresh_loop():
+    """Load contractors on startup and keep the cached snapshot fresh."""
+    from backend.infrastructure.repositories.sheets.contractor_repo import refresh_contractors  # noqa: PLC0415
+
+    while True:
+        try:
+            await asyncio.get_running_loop().run_in_executor(None, refresh_contractors)
+        except Exception:
+            logger.exception("Contractors refresh failed")
+        await asyncio.sleep(CONTRACTORS_REFRESH_INTERVAL)
+
+
 @asynccontextmanager
 async def lifespan(_app):
     """Start background tasks on API startup."""
     tasks = [
         asyncio.create_task(_goal_monitor_loop()),
+        asyncio.create_task(_contractors_refresh_loop()),
     ]
     yield
     for t in tasks:
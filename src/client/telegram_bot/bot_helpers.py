@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import re
 from datetime import date
+from functools import lru_cache
 
 from aiogram import Bot
 
@@ -17,7 +18,11 @@ bot = Bot(token=TELEGRAM_BOT_TOKEN)
 
 def prev_month() -> str:
     """Return previous month as 'YYYY-MM'."""
-    today = date.today()
+    return _month_before(date.today())
+
+
+@lru_cache(maxsize=1)
+def _month_before(today: date) -> str:
     if today.month == 1:
         return f"{today.year - 1}-12"
     return f"{today.year}-{today.month - 1:02d}"
@@ -50,9 +55,14 @@ def get_admin_ids() -> set[int]:
 
 # ─── Markdown → Telegram HTML ────────────────────────────────────────
 
+_MD_CODE_BLOCK_RE = re.compile(r"```(?:\w*)\n?(.*?)```", re.DOTALL)
+_MD_INLINE_CODE_RE = re.compile(r"`([^`\n]+)`")
+_MD_BOLD_RE = re.compile(r"\*\*(.+?)\*\*", re.DOTALL)
+
+
 def md_to_tg_html(text: str) -> str:
     """Convert standard markdown to Telegram-compatible HTML."""
     text = text.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
-    text = re.sub(r"```(?:\w*)\n?(.*?)```", r"<pre>\1</pre>", text, flags=re.DOTALL)
-    text = re.sub(r"`([^`\n]+)`", r"<code>\1</code>", text)
-    return re.sub(r"\*\*(.+?)\*\*", r"<b>\1</b>", text, flags=re.DOTALL)
+    text = _MD_CODE_BLOCK_RE.sub(r"<pre>\1</pre>", text)
+    text = _MD_INLINE_CODE_RE.sub(r"<code>\1</code>", text)
+    return _MD_BOLD_RE.sub(r"<b>\1</b>", text)
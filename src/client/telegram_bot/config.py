@@ -15,6 +15,15 @@ ADMIN_TELEGRAM_TAG = os.environ["ADMIN_TELEGRAM_TAG"]
 BOT_USERNAME = os.getenv("BOT_USERNAME", "")
 PRODUCT_NAME = os.getenv("PRODUCT_NAME", "")
 
+# --- Webhook (long polling is used when WEBHOOK_URL is unset) ---
+WEBHOOK_URL = os.getenv("WEBHOOK_URL", "")
+WEBHOOK_PATH = os.getenv("WEBHOOK_PATH", "/tg")
+# Required with a webhook: Telegram echoes it in every push, and without it any
+# POST to the path would be accepted as an update (with a forgeable from_user)
+WEBHOOK_SECRET = os.environ["WEBHOOK_SECRET"] if WEBHOOK_URL else ""
+WEBHOOK_HOST = os.getenv("WEBHOOK_HOST", "0.0.0.0")
+WEBHOOK_PORT = int(os.getenv("WEBHOOK_PORT", "8080"))
+
 # --- Telethon (for chat history, user session) ---
 TELEGRAM_API_ID = int(os.getenv("TELEGRAM_API_ID", "0"))
 TELEGRAM_API_HASH = os.getenv("TELEGRAM_API_HASH", "")
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import logging
+from collections import OrderedDict
 from datetime import date as _date
 
 from aiogram import types
@@ -14,23 +15,52 @@ from telegram_bot.bot_helpers import bot, md_to_tg_html, prev_month
 
 logger = logging.getLogger(__name__)
 
-# Maps (admin_chat_id, bot_message_id) -> (contractor_telegram_id, contractor_id)
+
+def _reply_key(chat_id: int, message_id: int) -> int:
+    """Pack (chat_id, message_id) into one int key for the reply maps below.
+
+    Message ids are 32-bit; Python ints are unbounded, so negative group
+    chat ids shift cleanly and keys stay unique.
+    """
+    return (chat_id << 32) | (message_id & 0xFFFFFFFF)
+
+
+class _ReplyMap(OrderedDict):
+    """Reply-target map that drops its oldest entries past ``maxsize``.
+
+    Only replies to recent bot messages matter, and most entries are never
+    popped, so an uncapped dict would grow for the life of the process.
+    """
+
+    def __init__(self, maxsize: int = 10_000):
+        super().__init__()
+        self.maxsize = maxsize
+
+    def __setitem__(self, key, value) -> None:
+        super().__setitem__(key, value)
+        self.move_to_end(key)
+        if len(self) > self.maxsize:
+            self.popitem(last=False)
+
+
+# Maps _reply_key(admin_chat_id, bot_message_id) -> (contractor_telegram_id, contractor_id)
 # so admin can reply to a notification and the reply gets forwarded.
-_admin_reply_map: dict[tuple[int, int], tuple[str, str]] = {}
+_admin_reply_map: dict[int, tuple[str, str]] = _ReplyMap()
 
-# Maps (admin_chat_id, bot_message_id) -> email uid
+# Maps _reply_key(admin_chat_id, bot_message_id) -> email uid
 # so admin can reply to a support draft message.
-_support_draft_map: dict[tuple[int, int], str] = {}
+_support_draft_map: dict[int, str] = _ReplyMap()
 
-# Maps (chat_id, bot_message_id) -> entry_id
+# Maps _reply_key(chat_id, bot_message_id) -> entry_id
 # so admin can reply to a kedit message with new content.
-_kedit_pending: dict[tuple[int, int], str] = {}
+_kedit_pending: dict[int, str] = _ReplyMap()
 
 __all__ = [
     "ThinkingMessage",
     "_admin_reply_map",
     "_kedit_pending",
     "_parse_flags",
+    "_reply_key",
     "_safe_edit_text",
     "_save_turn",
     "_send",
@@ -16,6 +16,7 @@ from telegram_bot.config import TELEGRAM_API_ID, TELEGRAM_SESSION
 from telegram_bot.handler_utils import (
     ThinkingMessage,
     _admin_reply_map,
+    _reply_key,
     _support_draft_map,
     parse_month_arg,
     resolve_environment_record,
@@ -123,7 +124,7 @@ async def cmd_upload_to_airtable(message: types.Message, state: FSMContext) -> N
 
     file = await bot.get_file(message.document.file_id)
     file_bytes = await bot.download_file(file.file_path)
-    file_b64 = base64.b64encode(file_bytes.read()).decode()
+    file_b64 = base64.b64encode(file_bytes.getbuffer()).decode()
 
     result = await backend_client.interact(
         action="admin_upload_statement",
@@ -285,7 +286,8 @@ _LEGIUM_PROMPT_MARKER = "ссылкой из Легиума"
 
 
 async def _try_legium_reply(message, state, key) -> bool:
-    entry = _admin_reply_map.get(key)
+    # Pop up front so concurrent replies to the same notification can't both claim it
+    entry = _admin_reply_map.pop(key, None)
     if entry:
         contractor_tg, contractor_id = entry
         payload = {"text": message.text.strip(), "contractor_id": contractor_id,
@@ -309,8 +311,9 @@ async def _try_legium_reply(message, state, key) -> bool:
             context={"user_id": message.from_user.id, "chat_id": message.chat.id, "is_admin": True},
         )
         await render(message, state, result)
-        _admin_reply_map.pop(key, None)
     except Exception as e:
+        if entry:
+            _admin_reply_map.setdefault(key, entry)  # keep it so the admin can retry
         await message.answer(replies.invoice.legium_send_error.format(error=e))
     return True
 
@@ -319,13 +322,16 @@ async def handle_admin_reply(message: types.Message, state: FSMContext) -> None:
     reply = message.reply_to_message
     if not reply:
         return
-    key = (message.chat.id, reply.message_id)
+    key = _reply_key(message.chat.id, reply.message_id)
     if await _try_legium_reply(message, state, key):
         return
-    uid = _support_draft_map.get(key)
+    uid = _support_draft_map.pop(key, None)
     if uid:
-        await _handle_draft_reply(message, uid)
-        del _support_draft_map[key]
+        try:
+            await _handle_draft_reply(message, uid)
+        except Exception:
+            _support_draft_map.setdefault(key, uid)  # keep it so the admin's retry still routes here
+            raise
         return
     if await handle_kedit_reply(message):
         return
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import base64
 import logging
 
@@ -12,6 +13,7 @@ from aiogram.types import CallbackQuery
 from telegram_bot import backend_client, replies
 from telegram_bot.bot_helpers import bot, get_admin_ids, is_admin
 from telegram_bot.handler_utils import ThinkingMessage, send_typing
+from telegram_bot.outbound import throttle
 from telegram_bot.renderer import render
 
 logger = logging.getLogger(__name__)
@@ -82,7 +84,6 @@ async def _interact(message: types.Message, state: FSMContext, action: str,
 
 async def _interact_callback(callback: CallbackQuery, state: FSMContext,
                              action: str) -> None:
-    await callback.answer()
     msg = callback.message
     fsm_state = await state.get_state()
     fsm_data = await state.get_data()
@@ -157,6 +158,7 @@ async def handle_type_selection(message: types.Message, state: FSMContext) -> st
 
 
 async def handle_data_input(message: types.Message, state: FSMContext) -> str | None:
+    await send_typing(message.chat.id)
     await _interact(message, state, "data_input")
     return None
 
@@ -173,6 +175,7 @@ async def handle_amount_input(message: types.Message, state: FSMContext) -> str
 
 
 async def handle_update_data(message: types.Message, state: FSMContext) -> str | None:
+    await send_typing(message.chat.id)
     await _interact(message, state, "update_data")
     return None
 
@@ -206,20 +209,25 @@ async def handle_document(message: types.Message, state: FSMContext) -> None:
     if message.document:
         file = await bot.get_file(message.document.file_id)
         data = await bot.download_file(file.file_path)
-        extra["file_b64"] = base64.b64encode(data.read()).decode()
+        extra["file_b64"] = base64.b64encode(data.getbuffer()).decode()
         extra["filename"] = message.document.file_name or "document"
         extra["mime"] = message.document.mime_type or ""
 
     await _interact(message, state, "document", extra)
 
     # Forward the original Telegram document to admins (backend can't do this)
-    admin_ids = get_admin_ids()
-    for admin_id in admin_ids:
-        if admin_id != message.from_user.id:
-            try:
-                await bot.forward_message(admin_id, message.chat.id, message.message_id)
-            except Exception:
-                logger.warning("Failed to forward document to admin %s", admin_id, exc_info=True)
+    await asyncio.gather(*(
+        _forward_to_admin(admin_id, message)
+        for admin_id in get_admin_ids() if admin_id != message.from_user.id
+    ))
+
+
+async def _forward_to_admin(admin_id: int, message: types.Message) -> None:
+    try:
+        await throttle()
+        await bot.forward_message(admin_id, message.chat.id, message.message_id)
+    except Exception:
+        logger.warning("Failed to forward document to admin %s", admin_id, exc_info=True)
 
 
 async def handle_receipt_link(message: types.Message, state: FSMContext) -> None:
@@ -238,7 +246,7 @@ async def handle_receipt_photo(message: types.Message, state: FSMContext) -> Non
     file = await bot.get_file(photo.file_id)
     data = await bot.download_file(file.file_path)
     extra = {
-        "file_b64": base64.b64encode(data.read()).decode(),
+        "file_b64": base64.b64encode(data.getbuffer()).decode(),
         "filename": f"receipt_{photo.file_unique_id}.jpg",
         "mime": "image/jpeg",
     }
@@ -8,7 +8,14 @@ from aiogram import types
 from aiogram.fsm.context import FSMContext
 
 from telegram_bot import backend_client, replies
-from telegram_bot.handler_utils import ThinkingMessage, _kedit_pending, _save_turn, _send, _send_html
+from telegram_bot.handler_utils import (
+    ThinkingMessage,
+    _kedit_pending,
+    _reply_key,
+    _save_turn,
+    _send,
+    _send_html,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -320,7 +327,7 @@ async def cmd_kedit(message: types.Message, _state: FSMContext) -> None:
     header = f"[{entry['tier']}] {entry['domain']} / {entry['title']}"
     text = f"{header}\n\n```\n{entry['content']}\n```\n\n{replies.knowledge.edit_prompt}"
     sent = await _send_html(message, text)
-    _kedit_pending[(message.chat.id, sent.message_id)] = entry_id
+    _kedit_pending[_reply_key(message.chat.id, sent.message_id)] = entry_id
 
 
 async def handle_kedit_reply(message: types.Message) -> bool:
@@ -329,7 +336,7 @@ async def handle_kedit_reply(message: types.Message) -> bool:
     if not reply or not reply.from_user or not reply.from_user.is_bot:
         return False
 
-    key = (message.chat.id, reply.message_id)
+    key = _reply_key(message.chat.id, reply.message_id)
     entry_id = _kedit_pending.get(key)
     if not entry_id:
         return False
@@ -50,14 +50,14 @@ def _format_checkpoint(payload: dict) -> tuple[str, list[list[dict]]]:
     return text, keyboard
 
 
-async def checkpoint_callback(callback) -> None:
+async def checkpoint_callback(callback, callback_answer) -> None:
     """Handle checkpoint approve/skip buttons."""
     data = callback.data or ""
     if not data.startswith("chk:"):
         return
     parts = data.split(":", 2)
     if len(parts) < 3:
-        await callback.answer("Неверные данные")
+        callback_answer.text = "Неверные данные"
         return
     action, task_id = parts[1], parts[2]
     result = await backend_client.interact(
@@ -67,7 +67,6 @@ async def checkpoint_callback(callback) -> None:
     messages = result.get("messages", [])
     text = messages[0]["text"] if messages else "Готово"
     await callback.message.answer(text)
-    await callback.answer()
 
 
 async def goal_notification_task() -> None:
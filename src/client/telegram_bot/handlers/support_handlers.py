@@ -8,12 +8,14 @@ from aiogram import types
 from aiogram.exceptions import TelegramBadRequest
 from aiogram.fsm.context import FSMContext
 from aiogram.types import CallbackQuery, InlineKeyboardButton, InlineKeyboardMarkup
+from aiogram.utils.callback_answer import CallbackAnswer
 
 from telegram_bot import backend_client, replies
 from telegram_bot.bot_helpers import bot
 from telegram_bot.handler_utils import (
     ThinkingMessage,
     _parse_flags,
+    _reply_key,
     _safe_edit_text,
     _save_turn,
     _send,
@@ -154,30 +156,28 @@ async def cmd_health(message: types.Message, _state: FSMContext) -> None:
     await _send(message, text)
 
 
-async def handle_code_rate_callback(callback: CallbackQuery) -> None:
+async def handle_code_rate_callback(callback: CallbackQuery, callback_answer: CallbackAnswer) -> None:
     parts = callback.data.split(":")
     if len(parts) != 3:
-        await callback.answer()
         return
     _, task_id, rating = parts
     try:
         await backend_client.update_message_metadata(task_id, {"rating": int(rating)})
     except Exception:
         logger.exception("Failed to save code task rating")
-    await callback.answer("Оценка сохранена!")
+    callback_answer.text = "Оценка сохранена!"
     try:
         await callback.message.edit_reply_markup(reply_markup=None)
     except TelegramBadRequest:
         pass
 
 
-async def handle_support_callback(callback: CallbackQuery) -> None:
+async def handle_support_callback(callback: CallbackQuery, _state: FSMContext) -> None:
     """Handle send/skip button presses for tech support drafts."""
-    await callback.answer()
-    parts = callback.data.split(":")
-    if len(parts) != 3:
+    _, _, rest = callback.data.partition(":")
+    action, _, uid = rest.partition(":")
+    if not uid:
         return
-    _, action, uid = parts
 
     draft = await backend_client.get_pending_support(uid)
     if not draft:
@@ -193,13 +193,12 @@ async def handle_support_callback(callback: CallbackQuery) -> None:
         await _safe_edit_text(callback.message, replies.tech_support.skipped.format(from_addr=draft.get("from_addr", "")))
 
 
-async def handle_editorial_callback(callback: CallbackQuery) -> None:
+async def handle_editorial_callback(callback: CallbackQuery, _state: FSMContext) -> None:
     """Handle forward/skip button presses for editorial items."""
-    await callback.answer()
-    parts = callback.data.split(":")
-    if len(parts) != 3:
+    _, _, rest = callback.data.partition(":")
+    action, _, uid = rest.partition(":")
+    if not uid:
         return
-    _, action, uid = parts
 
     item = await backend_client.get_pending_editorial(uid)
     if not item:
@@ -225,17 +224,22 @@ def _format_draft_text(draft: dict) -> str:
     return f"{header}Subject: {draft['subject']}\n\n{draft['body']}\n\n{draft_header}\n{draft['draft_reply']}"
 
 
-def _support_buttons(uid: str) -> InlineKeyboardMarkup:
+# (label, action) per button; only the uid in callback_data varies per draft.
+_SUPPORT_BUTTONS = ((replies.tech_support.btn_send, "send"), (replies.tech_support.btn_skip, "skip"))
+_EDITORIAL_BUTTONS = ((replies.editorial.btn_forward, "fwd"), (replies.editorial.btn_skip, "skip"))
+
+
+def _draft_buttons(prefix: str, uid: str, layout: tuple[tuple[str, str], ...]) -> InlineKeyboardMarkup:
     return InlineKeyboardMarkup(inline_keyboard=[[
-        InlineKeyboardButton(text=replies.tech_support.btn_send, callback_data=f"support:send:{uid}"),
-        InlineKeyboardButton(text=replies.tech_support.btn_skip, callback_data=f"support:skip:{uid}"),
+        InlineKeyboardButton(text=label, callback_data=f"{prefix}:{action}:{uid}")
+        for label, action in layout
     ]])
 
 
 async def _send_support_draft(admin_id: int, draft: dict) -> None:
     text = _format_draft_text(draft)
-    sent = await bot.send_message(admin_id, text, reply_markup=_support_buttons(draft["uid"]))
-    _support_draft_map[(admin_id, sent.message_id)] = draft["uid"]
+    sent = await bot.send_message(admin_id, text, reply_markup=_draft_buttons("support", draft["uid"], _SUPPORT_BUTTONS))
+    _support_draft_map[_reply_key(admin_id, sent.message_id)] = draft["uid"]
 
 
 async def _send_editorial(admin_id: int, item: dict) -> None:
@@ -248,8 +252,5 @@ async def _send_editorial(admin_id: int, item: dict) -> None:
     )
     if item.get("reply_to_sender"):
         text += f"\n\n--- Автоответ ---\n{item['reply_to_sender']}"
-    buttons = InlineKeyboardMarkup(inline_keyboard=[[
-        InlineKeyboardButton(text=replies.editorial.btn_forward, callback_data=f"editorial:fwd:{item['uid']}"),
-        InlineKeyboardButton(text=replies.editorial.btn_skip, callback_data=f"editorial:skip:{item['uid']}"),
-    ]])
+    buttons = _draft_buttons("editorial", item["uid"], _EDITORIAL_BUTTONS)
     await bot.send_message(admin_id, text, reply_markup=buttons)
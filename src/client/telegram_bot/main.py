@@ -3,38 +3,142 @@
 from __future__ import annotations
 
 import asyncio
+import atexit
 import logging
+import logging.handlers
+import queue
+from collections.abc import Coroutine
 
 from aiogram import Dispatcher
 
 from telegram_bot.bot_helpers import bot, load_admin_ids
-from telegram_bot.handlers.channel_scraper import channel_scraper_task
-from telegram_bot.handlers.email_listener import email_listener_task
-from telegram_bot.handlers.goal_notifications import checkpoint_callback, goal_notification_task
-from telegram_bot.router import register_all, set_bot_commands
+from telegram_bot.config import WEBHOOK_HOST, WEBHOOK_PATH, WEBHOOK_PORT, WEBHOOK_SECRET, WEBHOOK_URL
+
+try:
+    import uvloop
+except ImportError:  # no uvloop wheels on Windows; the default loop is used there
+    uvloop = None
 
 logger = logging.getLogger(__name__)
-dp = Dispatcher()
-register_all(dp)
-dp.callback_query.register(checkpoint_callback, lambda c: c.data and c.data.startswith("chk:"))
 
-_background_tasks: set[asyncio.Task] = set()
+# Bounds in-flight update handlers so a burst of button presses can't spawn
+# unbounded tasks; long polls cut idle getUpdates round-trips.
+_MAX_CONCURRENT_UPDATES = 200
+_POLLING_TIMEOUT = 30
+_WEBHOOK_MAX_CONNECTIONS = 100
+
+
+def _setup_logging() -> None:
+    """Log through a queue; a listener thread does the stderr writes off the event loop."""
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    stream = logging.StreamHandler()
+    stream.setFormatter(logging.Formatter("%(asctime)s [%(name)s] %(levelname)s: %(message)s"))
+    listener = logging.handlers.QueueListener(log_queue, stream)
+    listener.start()
+    atexit.register(listener.stop)
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    queue_handler.setFormatter(logging.Formatter("%(message)s"))  # stream handler adds the prefix
+    logging.basicConfig(level=logging.INFO, handlers=[queue_handler])
+
+
+def _build_dispatcher() -> Dispatcher:
+    # The router pulls in every handler module; importing it here rather than at
+    # module level keeps `import telegram_bot.main` cheap and runs after logging
+    # is configured.
+    from telegram_bot.handlers.goal_notifications import checkpoint_callback  # noqa: PLC0415
+    from telegram_bot.router import ANSWER_AFTER_HANDLER, register_all  # noqa: PLC0415
+
+    dp = Dispatcher()
+    register_all(dp)
+    dp.callback_query.register(checkpoint_callback, lambda c: c.data and c.data.startswith("chk:"),
+                               flags=ANSWER_AFTER_HANDLER)
+    return dp
+
+
+async def _run_background(coro: Coroutine) -> None:
+    # A crashed poller is logged rather than tearing down the TaskGroup and polling
+    try:
+        await coro
+    except Exception:
+        logger.exception("Background task %s failed", coro.__qualname__)
 
 
 async def main():
-    logging.basicConfig(
-        level=logging.INFO,
-        format="%(asctime)s [%(name)s] %(levelname)s: %(message)s",
-    )
+    _setup_logging()
     logger.info("Starting bot...")
+    dp = _build_dispatcher()
+    from telegram_bot.handlers.channel_scraper import channel_scraper_task  # noqa: PLC0415
+    from telegram_bot.handlers.email_listener import email_listener_task  # noqa: PLC0415
+    from telegram_bot.handlers.goal_notifications import goal_notification_task  # noqa: PLC0415
+    from telegram_bot.router import set_bot_commands  # noqa: PLC0415
+
     await load_admin_ids()
     await set_bot_commands(bot)
-    for coro in (email_listener_task(), channel_scraper_task(), goal_notification_task()):
-        task = asyncio.create_task(coro)
-        _background_tasks.add(task)
-        task.add_done_callback(_background_tasks.discard)
-    await dp.start_polling(bot)
+    async with asyncio.TaskGroup() as tg:
+        workers = [
+            tg.create_task(_run_background(coro))
+            for coro in (email_listener_task(), channel_scraper_task(), goal_notification_task())
+        ]
+        try:
+            if WEBHOOK_URL:
+                await _run_webhook(dp)
+            else:
+                await _run_polling(dp)
+        finally:
+            # The pollers loop forever; stop them so the group can exit with polling
+            for worker in workers:
+                worker.cancel()
+
+
+async def _run_polling(dp: Dispatcher) -> None:
+    # getUpdates is refused while a webhook is registered
+    await bot.delete_webhook()
+    await dp.start_polling(
+        bot,
+        handle_as_tasks=True,
+        tasks_concurrency_limit=_MAX_CONCURRENT_UPDATES,
+        polling_timeout=_POLLING_TIMEOUT,
+        allowed_updates=dp.resolve_used_update_types(),
+    )
+
+
+def _concurrency_limit(limit: int):
+    """Outer update middleware capping how many updates are handled at once."""
+    semaphore = asyncio.Semaphore(limit)
+
+    async def middleware(handler, event, data):
+        async with semaphore:
+            return await handler(event, data)
+
+    return middleware
+
+
+async def _run_webhook(dp: Dispatcher) -> None:
+    """Receive updates pushed by Telegram instead of polling getUpdates."""
+    from aiogram.webhook.aiohttp_server import SimpleRequestHandler, setup_application  # noqa: PLC0415
+    from aiohttp import web  # noqa: PLC0415
+
+    # Webhook updates are fed in background tasks with no cap of their own;
+    # apply the same bound start_polling gets from tasks_concurrency_limit
+    dp.update.outer_middleware(_concurrency_limit(_MAX_CONCURRENT_UPDATES))
+    app = web.Application()
+    SimpleRequestHandler(dispatcher=dp, bot=bot, secret_token=WEBHOOK_SECRET).register(app, path=WEBHOOK_PATH)
+    setup_application(app, dp, bot=bot)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    try:
+        await web.TCPSite(runner, host=WEBHOOK_HOST, port=WEBHOOK_PORT).start()
+        await bot.set_webhook(
+            WEBHOOK_URL.rstrip("/") + WEBHOOK_PATH,
+            secret_token=WEBHOOK_SECRET,
+            max_connections=_WEBHOOK_MAX_CONNECTIONS,
+            allowed_updates=dp.resolve_used_update_types(),
+        )
+        logger.info("Webhook listening on %s:%d%s", WEBHOOK_HOST, WEBHOOK_PORT, WEBHOOK_PATH)
+        await asyncio.Event().wait()
+    finally:
+        await runner.cleanup()
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    asyncio.run(main(), loop_factory=uvloop.new_event_loop if uvloop else None)
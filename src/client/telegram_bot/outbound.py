@@ -0,0 +1,42 @@
+"""Outbound send pacing — keeps fan-out bursts under Telegram's global rate limit."""
+
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+
+__all__ = [
+    "throttle",
+]
+
+# Telegram allows ~30 messages per second per bot across all chats.
+_MAX_SENDS = 30
+_WINDOW = 1.0
+
+
+class _SendWindow:
+    """Sliding-window limiter: at most ``limit`` sends per ``window`` seconds."""
+
+    def __init__(self, limit: int, window: float) -> None:
+        self._limit = limit
+        self._window = window
+        self._sent: deque[float] = deque()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        async with self._lock:
+            loop = asyncio.get_running_loop()
+            now = loop.time()
+            while self._sent and now - self._sent[0] >= self._window:
+                self._sent.popleft()
+            if len(self._sent) >= self._limit:
+                await asyncio.sleep(self._window - (now - self._sent.popleft()))
+            self._sent.append(loop.time())
+
+
+_send_window = _SendWindow(_MAX_SENDS, _WINDOW)
+
+
+async def throttle() -> None:
+    """Wait for a free slot in the global send window before a fan-out send."""
+    await _send_window.acquire()
@@ -1,12 +1,18 @@
 """Generic renderer — converts backend interact responses into Telegram messages."""
 
+import asyncio
 import base64
 import logging
+from collections import defaultdict
+from functools import lru_cache
 
 from aiogram.types import BufferedInputFile, InlineKeyboardButton, InlineKeyboardMarkup
+from aiogram.utils.keyboard import InlineKeyboardBuilder
 
 from telegram_bot.bot_helpers import bot
-from telegram_bot.handler_utils import _admin_reply_map, _send
+from telegram_bot.handler_utils import _admin_reply_map, _reply_key, _send
+from telegram_bot.outbound import throttle
+from telegram_bot.states import ContractorStates
 
 logger = logging.getLogger(__name__)
 
@@ -35,22 +41,22 @@ def _fmt_articles_list(d: dict) -> str:
             f"{ids_list}")
 
 
-def _fmt_operation_summary(d: dict) -> str:
-    parts = [d["header"]]
+def _operation_summary_parts(d: dict):
+    yield d["header"]
     counts = d.get("counts")
     if counts:
-        total = d.get("total_generated", 0)
-        if total:
-            parts.append(
-                f"Сгенерировано: {counts['global']} global, "
-                f"{counts['samozanyaty']} самозанятых, {counts['ip']} ИП"
-            )
+        if d.get("total_generated", 0):
+            yield (f"Сгенерировано: {counts['global']} global, "
+                   f"{counts['samozanyaty']} самозанятых, {counts['ip']} ИП")
         else:
-            parts.append("Новых счетов не сгенерировано.")
+            yield "Новых счетов не сгенерировано."
     errors = d.get("errors")
     if errors:
-        parts.append("Ошибки:\n" + "\n".join(f"  - {e}" for e in errors))
-    return "\n\n".join(parts)
+        yield "Ошибки:\n" + "\n".join(f"  - {e}" for e in errors)
+
+
+def _fmt_operation_summary(d: dict) -> str:
+    return "\n\n".join(_operation_summary_parts(d))
 
 
 def _fmt_orphan_list(d: dict) -> str:
@@ -63,25 +69,31 @@ def _fmt_fuzzy_suggestions(d: dict) -> str:
     return f"Точного совпадения нет. Возможные варианты:\n{suggestions}"
 
 
-def _fmt_registration_progress(d: dict) -> str:
-    filled_lines = "\n".join(f"  ✓ {f['label']}: {f['value']}" for f in d["filled"])
-    parts = [f"Вот что я уже получил:\n{filled_lines}"]
+def _registration_progress_parts(d: dict):
+    yield "Вот что я уже получил:\n" + "\n".join(f"  ✓ {f['label']}: {f['value']}" for f in d["filled"])
     if d.get("missing"):
-        parts.append(f"Ещё нужно: {', '.join(d['missing'])}.")
+        yield f"Ещё нужно: {', '.join(d['missing'])}."
     if d.get("warnings"):
-        parts.append("\n".join(f"  ⚠ {w}" for w in d["warnings"]))
-    parts.append("Пришлите исправленные/недостающие данные.")
-    return "\n\n".join(parts)
+        yield "\n".join(f"  ⚠ {w}" for w in d["warnings"])
+    yield "Пришлите исправленные/недостающие данные."
 
 
-def _fmt_registration_complete(d: dict) -> str:
+def _fmt_registration_progress(d: dict) -> str:
+    return "\n\n".join(_registration_progress_parts(d))
+
+
+def _registration_complete_parts(d: dict):
     summary = "\n".join(f"  {f['label']}: {f['value']}" for f in d["fields"])
     if d.get("aliases"):
         summary += f"\n  псевдонимы: {', '.join(d['aliases'])}"
-    text = f"Ваши данные:\n{summary}\n\nВы добавлены в систему!"
+    yield f"Ваши данные:\n{summary}"
+    yield "Вы добавлены в систему!"
     if d.get("secret_code"):
-        text += f"\n\nВаш секретный код: *{d['secret_code']}*."
-    return text
+        yield f"Ваш секретный код: *{d['secret_code']}*."
+
+
+def _fmt_registration_complete(d: dict) -> str:
+    return "\n\n".join(_registration_complete_parts(d))
 
 
 def _fmt_invoice_admin_caption(d: dict) -> str:
@@ -148,10 +160,17 @@ def _resolve_text(m: dict) -> str:
 # ── Rendering ────────────────────────────────────────────────────────
 
 def _build_keyboard(data: list[list[dict]]) -> InlineKeyboardMarkup:
-    return InlineKeyboardMarkup(inline_keyboard=[
-        [InlineKeyboardButton(text=b["text"], callback_data=b["data"]) for b in row]
-        for row in data
-    ])
+    return _keyboard_markup(tuple(tuple((b["text"], b["data"]) for b in row) for row in data))
+
+
+# Most backend keyboards (type choice, menus, confirmations) are static, so the
+# same layout maps to one shared markup instead of fresh pydantic models per send.
+@lru_cache(maxsize=256)
+def _keyboard_markup(rows: tuple[tuple[tuple[str, str], ...], ...]) -> InlineKeyboardMarkup:
+    kb = InlineKeyboardBuilder()
+    for row in rows:
+        kb.row(*(InlineKeyboardButton(text=text, callback_data=data) for text, data in row))
+    return kb.as_markup()
 
 
 async def render(message, state, result: dict) -> None:
@@ -168,27 +187,49 @@ async def _send_main_messages(message, messages: list[dict]) -> None:
             _track_admin_reply(message.chat.id, sent.message_id, m)
 
 
+class _FileIds(dict[str, str]):
+    """file_b64 -> Telegram file_id for one batch of side messages.
+
+    Identical documents (e.g. one invoice fanned out to every admin) are
+    uploaded once and re-sent by id; concurrent senders of the same file
+    wait on its upload lock instead of uploading it again.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.upload_locks: defaultdict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
+
+
 async def _send_side_messages(side_messages: list[dict]) -> None:
+    # Chats are independent, so they are sent to concurrently; messages to
+    # the same chat stay in order.
+    by_chat: dict[int, list[dict]] = {}
+    for sm in side_messages:
+        by_chat.setdefault(sm.get("chat_id"), []).append(sm)
+    file_ids = _FileIds()
+    await asyncio.gather(*(
+        _send_chat_side_messages(chat_id, msgs, file_ids) for chat_id, msgs in by_chat.items()
+    ))
+
+
+async def _send_chat_side_messages(chat_id: int, side_messages: list[dict], file_ids: _FileIds) -> None:
     for sm in side_messages:
         try:
-            chat_id = sm["chat_id"]
-            sent = await _send_message_to_chat(chat_id, sm)
+            await throttle()
+            sent = await _send_message_to_chat(chat_id, sm, file_ids=file_ids)
             if sent:
                 _track_admin_reply(chat_id, sent.message_id, sm)
         except Exception:
-            logger.warning("Failed to send side message to %s", sm.get("chat_id"), exc_info=True)
+            logger.warning("Failed to send side message to %s", chat_id, exc_info=True)
 
 
-async def _send_message_to_chat(chat_id: int, m: dict, reply_message=None):
+async def _send_message_to_chat(chat_id: int, m: dict, reply_message=None,
+                                file_ids: _FileIds | None = None):
     keyboard = _build_keyboard(m["keyboard"]) if m.get("keyboard") else None
     text = _resolve_text(m)
 
     if m.get("file_b64"):
-        doc = BufferedInputFile(
-            base64.b64decode(m["file_b64"]),
-            filename=m.get("filename", "file"),
-        )
-        return await bot.send_document(chat_id, doc, caption=text or None, reply_markup=keyboard)
+        return await _send_document(chat_id, m, text, keyboard, file_ids)
     if text and reply_message:
         return await _send(reply_message, text, reply_markup=keyboard)
     if text:
@@ -196,10 +237,30 @@ async def _send_message_to_chat(chat_id: int, m: dict, reply_message=None):
     return None
 
 
+async def _send_document(chat_id: int, m: dict, text: str, keyboard,
+                         file_ids: _FileIds | None):
+    file_b64 = m["file_b64"]
+    if file_ids is None:
+        return await _upload_document(chat_id, m, text, keyboard)
+    async with file_ids.upload_locks[file_b64]:
+        file_id = file_ids.get(file_b64)
+        if file_id is None:
+            sent = await _upload_document(chat_id, m, text, keyboard)
+            if sent.document:
+                file_ids[file_b64] = sent.document.file_id
+            return sent
+    return await bot.send_document(chat_id, file_id, caption=text or None, reply_markup=keyboard)
+
+
+async def _upload_document(chat_id: int, m: dict, text: str, keyboard):
+    doc = BufferedInputFile(base64.b64decode(m["file_b64"]), filename=m.get("filename", "file"))
+    return await bot.send_document(chat_id, doc, caption=text or None, reply_markup=keyboard)
+
+
 def _track_admin_reply(chat_id: int, message_id: int, m: dict) -> None:
     track = m.get("track")
     if track and track.get("type") == "admin_reply":
-        _admin_reply_map[(chat_id, message_id)] = (
+        _admin_reply_map[_reply_key(chat_id, message_id)] = (
             track["contractor_telegram"], track["contractor_id"],
         )
 
@@ -209,7 +270,6 @@ async def _apply_fsm(state, result: dict) -> None:
         if result["fsm_state"] is None:
             await state.clear()
         else:
-            from telegram_bot.router import ContractorStates  # noqa: PLC0415 (circular import)
             target = getattr(ContractorStates, result["fsm_state"], None)
             if target:
                 await state.set_state(target)
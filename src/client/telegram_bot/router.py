@@ -21,10 +21,10 @@ import re
 from collections.abc import Callable
 
 from aiogram import Dispatcher, F, types
-from aiogram.enums import ChatAction
+from aiogram.enums import ContentType
 from aiogram.fsm.context import FSMContext
-from aiogram.fsm.state import State, StatesGroup
 from aiogram.types import BotCommand
+from aiogram.utils.callback_answer import CallbackAnswerMiddleware
 
 from telegram_bot import backend_client
 from telegram_bot.bot_helpers import is_admin
@@ -93,6 +93,7 @@ from telegram_bot.handlers.support_handlers import (
     handle_editorial_callback,
     handle_support_callback,
 )
+from telegram_bot.states import ContractorStates
 
 logger = logging.getLogger(__name__)
 
@@ -100,18 +101,6 @@ logger = logging.getLogger(__name__)
 _LLM_COMMANDS = {"code", "support"}
 
 
-# ── FSM States ────────────────────────────────────────────────────────
-
-class ContractorStates(StatesGroup):
-    lookup = State()
-    waiting_verification = State()
-    waiting_type = State()
-    waiting_data = State()
-    waiting_amount = State()
-    waiting_update_data = State()
-    waiting_editor_source_name = State()
-
-
 # ── FSM Tables ────────────────────────────────────────────────────────
 
 # state name → handler function
@@ -125,6 +114,27 @@ _FSM_HANDLERS: dict[str, Callable] = {
     "waiting_editor_source_name": handle_editor_source_name,
 }
 
+# Full stored state ("ContractorStates:waiting_data") → handler, so FSM routing
+# is one dict lookup on state.get_state() with no string splitting
+_FSM_HANDLERS_BY_STATE: dict[str, Callable] = {
+    getattr(ContractorStates, name).state: handler for name, handler in _FSM_HANDLERS.items()
+}
+
+# ── Callback Table ────────────────────────────────────────────────────
+
+# callback_data prefix (text before the first ":") → handler(callback, state)
+_CALLBACK_HANDLERS: dict[str, Callable] = {
+    "support": handle_support_callback,
+    "editorial": handle_editorial_callback,
+    "start": handle_start_callback,
+    "dup": handle_duplicate_callback,
+    "esrc": handle_editor_source_callback,
+    "menu": handle_linked_menu_callback,
+}
+
+# One compiled match picks the handler instead of a startswith filter per prefix
+_CALLBACK_PREFIX_RE = re.compile(f"({'|'.join(map(re.escape, _CALLBACK_HANDLERS))}):")
+
 # ── Command Registries ────────────────────────────────────────────────
 
 # Available to all DM users
@@ -191,6 +201,7 @@ _COMMAND_DESCRIPTIONS: dict[str, str] = {
 _GROUP_ALLOWED_COMMANDS = ["health", "support", "articles", "lookup"]
 
 __all__ = [
+    "ANSWER_AFTER_HANDLER",
     "_ADMIN_COMMANDS",
     "_COMMAND_DESCRIPTIONS",
     "_DM_COMMANDS",
@@ -336,11 +347,11 @@ def _build_nl_kwargs(clean_text: str, message: types.Message, *, is_reply_to_bot
 async def _route_fsm(
     message: types.Message, state: FSMContext, current_state: str,
 ) -> None:
-    state_name = current_state.rsplit(":", maxsplit=1)[-1]
-    handler = _FSM_HANDLERS.get(state_name)
+    handler = _FSM_HANDLERS_BY_STATE.get(current_state)
     if not handler:
         return
-    await message.bot.send_chat_action(message.chat.id, ChatAction.TYPING)
+    # Handlers that hit Sheets/LLM send their own typing action; quick
+    # steps (type choice, verification code) answer without the extra call.
     await handler(message, state)
 
 
@@ -383,11 +394,11 @@ async def _route_group(message: types.Message, state: FSMContext) -> None:
 
 async def _route_dm_command(message: types.Message, state: FSMContext) -> None:
     cmd = _parse_command(message.text)
-    if cmd in _DM_COMMANDS:
-        await _DM_COMMANDS[cmd](message, state)
-        return
-    if is_admin(message.from_user.id) and cmd in _ADMIN_COMMANDS:
-        await _ADMIN_COMMANDS[cmd](message, state)
+    handler = _DM_COMMANDS.get(cmd)
+    if handler is None and is_admin(message.from_user.id):
+        handler = _ADMIN_COMMANDS.get(cmd)
+    if handler:
+        await handler(message, state)
 
 
 async def _route_text(message: types.Message, state: FSMContext) -> None:
@@ -431,6 +442,11 @@ async def _route_dm_nl(message: types.Message, text: str) -> None:
         await message.answer("Не удалось обработать.")
 
 
+async def _route_callback(callback: types.CallbackQuery, state: FSMContext,
+                          callback_prefix: re.Match) -> None:
+    await _CALLBACK_HANDLERS[callback_prefix[1]](callback, state)
+
+
 # ── Admin Documents ───────────────────────────────────────────────────
 
 async def _route_admin_document(message: types.Message, state: FSMContext) -> None:
@@ -445,6 +461,16 @@ async def _route_admin_document(message: types.Message, state: FSMContext) -> No
 
 # ── Registration ──────────────────────────────────────────────────────
 
+# Handler flags for callbacks that answer with text once their work is done
+ANSWER_AFTER_HANDLER = {"callback_answer": {"pre": False}}
+
+# Non-document media routed to handle_non_document
+_MEDIA_CONTENT_TYPES = frozenset({
+    ContentType.PHOTO, ContentType.STICKER, ContentType.VIDEO,
+    ContentType.VOICE, ContentType.VIDEO_NOTE, ContentType.AUDIO,
+})
+
+
 async def set_bot_commands(bot) -> None:
     await bot.set_my_commands([
         BotCommand(command="menu", description="Меню"),
@@ -453,14 +479,12 @@ async def set_bot_commands(bot) -> None:
 
 def register_all(dp: Dispatcher) -> None:
     """Wire everything onto the dispatcher — one place to see all handlers."""
-    # Callback queries
-    dp.callback_query.register(handle_support_callback, F.data.startswith("support:"))
-    dp.callback_query.register(handle_editorial_callback, F.data.startswith("editorial:"))
-    dp.callback_query.register(handle_start_callback, F.data.startswith("start:"))
-    dp.callback_query.register(handle_duplicate_callback, F.data.startswith("dup:"))
-    dp.callback_query.register(handle_editor_source_callback, F.data.startswith("esrc:"))
-    dp.callback_query.register(handle_linked_menu_callback, F.data.startswith("menu:"))
-    dp.callback_query.register(handle_code_rate_callback, F.data.startswith("code_rate:"))
+    # Callback queries — the spinner is dismissed by the middleware, up front
+    # unless a handler opts into answering with text afterwards.
+    dp.callback_query.middleware(CallbackAnswerMiddleware(pre=True))
+    dp.callback_query.register(_route_callback, F.data.regexp(_CALLBACK_PREFIX_RE).as_("callback_prefix"))
+    dp.callback_query.register(handle_code_rate_callback, F.data.startswith("code_rate:"),
+                               flags=ANSWER_AFTER_HANDLER)
 
     # Single text handler — all routing in _route_text
     dp.message.register(_route_text, F.text)
@@ -475,7 +499,4 @@ def register_all(dp: Dispatcher) -> None:
     dp.message.register(handle_receipt_photo, F.photo, F.chat.type == "private")
 
     # Other media (stickers, video, etc. + group photos)
-    dp.message.register(
-        handle_non_document,
-        F.photo | F.sticker | F.video | F.voice | F.video_note | F.audio,
-    )
+    dp.message.register(handle_non_document, F.content_type.in_(_MEDIA_CONTENT_TYPES))
@@ -0,0 +1,13 @@
+"""FSM states shared by the router and the renderer."""
+
+from aiogram.fsm.state import State, StatesGroup
+
+
+class ContractorStates(StatesGroup):
+    lookup = State()
+    waiting_verification = State()
+    waiting_type = State()
+    waiting_data = State()
+    waiting_amount = State()
+    waiting_update_data = State()
+    waiting_editor_source_name = State()
@@ -0,0 +1,53 @@
+"""Tests for the contractor snapshot cache in contractor_repo."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from backend.infrastructure.repositories.sheets import contractor_repo
+from backend.models import ContractorType
+
+
+@pytest.fixture(autouse=True)
+def _reset_snapshot():
+    contractor_repo.invalidate_contractors()
+    yield
+    contractor_repo.invalidate_contractors()
+
+
+@patch("backend.infrastructure.repositories.sheets.contractor_repo._read_all_contractors")
+def test_load_reuses_snapshot(mock_read):
+    c = MagicMock()
+    mock_read.return_value = [c]
+
+    assert contractor_repo.load_all_contractors() == [c]
+    assert contractor_repo.load_all_contractors() == [c]
+    mock_read.assert_called_once()
+
+
+@patch("backend.infrastructure.repositories.sheets.contractor_repo.time")
+@patch("backend.infrastructure.repositories.sheets.contractor_repo._read_all_contractors")
+def test_load_rereads_after_ttl(mock_read, mock_time):
+    mock_read.return_value = []
+    mock_time.monotonic.return_value = 1000.0
+    contractor_repo.load_all_contractors()
+
+    mock_time.monotonic.return_value = 1000.0 + contractor_repo._SNAPSHOT_TTL + 1
+    contractor_repo.load_all_contractors()
+
+    assert mock_read.call_count == 2
+
+
+@patch("backend.infrastructure.repositories.sheets.contractor_repo._sheets")
+@patch("backend.infrastructure.repositories.sheets.contractor_repo._read_all_contractors")
+def test_write_invalidates_snapshot(mock_read, _mock_sheets):
+    mock_read.return_value = []
+    contractor_repo.load_all_contractors()
+
+    stub = MagicMock()
+    stub.type = ContractorType.IP
+    with patch.object(contractor_repo, "contractor_to_row", return_value=[]):
+        contractor_repo.save_contractor(stub)
+    contractor_repo.load_all_contractors()
+
+    assert mock_read.call_count == 2
@@ -0,0 +1,74 @@
+"""Tests for batched message fetching in EmailGateway."""
+
+import base64
+from unittest.mock import MagicMock, patch
+
+from backend.infrastructure.gateways import email_gateway
+from backend.infrastructure.gateways.email_gateway import EmailGateway
+
+
+class _FakeBatch:
+    """Stands in for googleapiclient's BatchHttpRequest."""
+
+    def __init__(self, callback, fail_ids):
+        self._callback = callback
+        self._fail_ids = fail_ids
+        self.requests = []
+
+    def add(self, request, request_id):
+        self.requests.append((request_id, request))
+
+    def execute(self):
+        for request_id, request in self.requests:
+            if request_id in self._fail_ids:
+                self._callback(request_id, None, RuntimeError("boom"))
+            else:
+                self._callback(request_id, request, None)
+
+
+def _fake_gmail(message_ids, fail_ids=()):
+    gmail = MagicMock()
+    messages = gmail.users.return_value.messages.return_value
+    messages.list.return_value.execute.return_value = {"messages": [{"id": i} for i in message_ids]}
+    # The "request" object doubles as the response the batch hands back
+    messages.get.side_effect = lambda **kw: {
+        "raw": base64.urlsafe_b64encode(f"Subject: {kw['id']}\n\nbody".encode()).decode(),
+    }
+    batches = []
+
+    def _new_batch(callback):
+        batch = _FakeBatch(callback, set(fail_ids))
+        batches.append(batch)
+        return batch
+
+    gmail.new_batch_http_request.side_effect = _new_batch
+    return gmail, batches
+
+
+@patch.object(email_gateway, "_BATCH_SIZE", 2)
+def test_fetch_raw_chunks_requests_into_batches():
+    gmail, batches = _fake_gmail([])
+
+    raw = EmailGateway._fetch_raw(gmail, ["m1", "m2", "m3", "m4", "m5"])
+
+    assert [[rid for rid, _ in b.requests] for b in batches] == [["m1", "m2"], ["m3", "m4"], ["m5"]]
+    assert list(raw) == ["m1", "m2", "m3", "m4", "m5"]
+    assert base64.urlsafe_b64decode(raw["m3"]).startswith(b"Subject: m3")
+
+
+def test_fetch_raw_skips_failed_messages():
+    gmail, _ = _fake_gmail([], fail_ids={"m2"})
+
+    raw = EmailGateway._fetch_raw(gmail, ["m1", "m2", "m3"])
+
+    assert set(raw) == {"m1", "m3"}
+
+
+@patch("backend.infrastructure.gateways.email_gateway.parse_email_message")
+def test_fetch_unread_keeps_list_order_and_drops_failures(mock_parse):
+    mock_parse.side_effect = lambda msg_id, msg: (msg_id, msg["Subject"])
+    gmail, _ = _fake_gmail(["m1", "m2", "m3"], fail_ids={"m1"})
+    gateway = EmailGateway()
+    gateway._service = gmail
+
+    assert gateway.fetch_unread() == [("m2", "m2"), ("m3", "m3")]
@@ -37,6 +37,7 @@ def _make_contractor(**overrides):
     c.currency = overrides.get("currency", Currency.RUB)
     for k, v in overrides.items():
         setattr(c, k, v)
+    c.secret_code_folded = c.secret_code.casefold()
     return c
 
 
@@ -780,6 +781,15 @@ def test_admin_generate_unknown_contractor(*_):
     assert len(result["messages"]) == 1
 
 
+@patch("backend.interact.admin.load_all_contractors", return_value=[])
+@patch("backend.interact.admin.find_contractor", return_value=None)
+@patch("backend.interact.admin.fuzzy_find", return_value=[])
+def test_admin_generate_strips_debug_prefix(_, mock_find, __):
+    handle("admin_generate", {"text": "DEBUG  Иван Петров"}, {"user_id": 1})
+
+    assert mock_find.call_args[0][0] == "Иван Петров"
+
+
 # ── Admin: articles ──────────────────────────────────────────────────
 
 
@@ -876,6 +886,17 @@ def test_admin_upload_statement_invalid_rate():
     assert len(result["messages"]) == 1
 
 
+@patch("backend.interact.admin.create_parse_bank_statement")
+def test_admin_upload_statement_parses_in_memory(mock_create):
+    mock_create.return_value.execute_stream.return_value = []
+
+    handle("admin_upload_statement", {"file_b64": "dGVzdA==", "rate": "3.5"}, {"user_id": 1})
+
+    csv_file, rate = mock_create.return_value.execute_stream.call_args[0]
+    assert csv_file.read() == b"test"
+    assert rate == 3.5
+
+
 # ── Admin: legium reply ──────────────────────────────────────────────
 
 
@@ -939,6 +960,18 @@ def test_admin_batch_generate_with_results(mock_batch_cls, *_):
     assert result["messages"][0]["data"]["type"].value == "operation_summary"
 
 
+@patch("backend.interact.admin.load_all_contractors", return_value=[])
+@patch("backend.interact.admin.create_generate_batch_invoices")
+def test_admin_batch_generate_debug_flag_is_whole_word(mock_batch_cls, *_):
+    mock_batch_cls.return_value.execute.return_value.total = 0
+
+    handle("admin_batch_generate", {"text": "DEBUG"}, {"user_id": 1})
+    handle("admin_batch_generate", {"text": "debugging"}, {"user_id": 1})
+
+    flags = [c.kwargs["debug"] for c in mock_batch_cls.return_value.execute.call_args_list]
+    assert flags == [True, False]
+
+
 # ── Admin: send global ──────────────────────────────────────────────
 
 
@@ -949,6 +982,28 @@ def test_admin_send_global_no_drafts(*_):
     assert len(result["messages"]) == 1
 
 
+@patch("backend.interact.admin.update_invoice_statuses")
+@patch("backend.interact.admin.DocsGateway")
+@patch("backend.interact.admin.load_all_contractors")
+@patch("backend.interact.admin.load_invoices")
+def test_admin_send_global_batches_status_updates(mock_invoices, mock_contractors, mock_docs, mock_update):
+    mock_contractors.return_value = [
+        _make_contractor(id="g1", telegram="101", currency=Currency.EUR),
+        _make_contractor(id="g2", telegram="102", currency=Currency.EUR),
+    ]
+    mock_invoices.return_value = [Invoice(
+        contractor_id=cid, invoice_number=0, month="2026-02", amount=100,
+        currency=Currency.EUR, status=InvoiceStatus.DRAFT, doc_id="doc",
+    ) for cid in ("g1", "g2")]
+    mock_docs.return_value.export_pdf.return_value = b"%PDF"
+
+    result = handle("admin_send_global", {"text": ""}, {"user_id": 1})
+
+    mock_update.assert_called_once()
+    assert [u[0] for u in mock_update.call_args[0][0]] == ["g1", "g2"]
+    assert len(result["side_messages"]) == 2
+
+
 # ── Admin: send legium ──────────────────────────────────────────────
 
 
@@ -973,11 +1028,9 @@ def test_remind_receipts_none_missing(*_):
 
 @patch("backend.interact.admin.load_invoices")
 @patch("backend.interact.admin.load_all_contractors")
-@patch("backend.interact.admin.find_contractor_by_id")
-def test_remind_receipts_sends_reminders(mock_find, mock_contractors, mock_invoices):
+def test_remind_receipts_sends_reminders(mock_contractors, mock_invoices):
     c = _make_samozanyaty(tid="555")
     mock_contractors.return_value = [c]
-    mock_find.return_value = c
     mock_invoices.return_value = [Invoice(
         contractor_id="c1", invoice_number=1, month="2026-02",
         amount=1000, currency=Currency.RUB, status=InvoiceStatus.PAID,
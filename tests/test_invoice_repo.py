@@ -0,0 +1,53 @@
+"""Tests for invoice row lookup and status writes in invoice_repo."""
+
+from unittest.mock import patch
+
+from backend.infrastructure.repositories.sheets import invoice_repo
+from backend.models import InvoiceStatus
+
+_ROWS = [
+    ["Contractor_ID", "month", "amount", "status"],
+    ["c1", "2026-09", "100", "draft"],
+    ["c2", "2026-09"],                     # short row, padded before matching
+    ["c1", "2026-08", "50", "paid"],
+    ["c2", "2026-09", "70", "draft"],      # duplicate key, first row wins
+]
+
+
+@patch.object(invoice_repo, "_sheets")
+def test_update_invoice_statuses_batches_status_cells(mock_sheets):
+    mock_sheets.read.return_value = _ROWS
+
+    invoice_repo.update_invoice_statuses([
+        ("c1", "2026-09", InvoiceStatus.SENT),
+        ("c9", "2026-09", InvoiceStatus.SENT),  # not in the sheet, skipped
+        ("c2", "2026-09", InvoiceStatus.PAID),
+        ("c1", "2026-08", InvoiceStatus.SENT),
+    ])
+
+    mock_sheets.read.assert_called_once()
+    mock_sheets.batch_write.assert_called_once_with(invoice_repo.CONTRACTORS_SHEET_ID, [
+        ("'invoices'!D2", [["sent"]]),
+        ("'invoices'!D3", [["paid"]]),
+        ("'invoices'!D4", [["sent"]]),
+    ])
+
+
+@patch.object(invoice_repo, "_sheets")
+def test_update_invoice_statuses_skips_write_when_nothing_matches(mock_sheets):
+    mock_sheets.read.return_value = _ROWS
+
+    invoice_repo.update_invoice_statuses([("c9", "2026-09", InvoiceStatus.SENT)])
+
+    mock_sheets.batch_write.assert_not_called()
+
+
+@patch.object(invoice_repo, "_sheets")
+def test_update_invoice_status_writes_single_cell(mock_sheets):
+    mock_sheets.read.return_value = _ROWS
+
+    invoice_repo.update_invoice_status("c1", "2026-08", InvoiceStatus.PAID)
+
+    mock_sheets.write.assert_called_once_with(
+        invoice_repo.CONTRACTORS_SHEET_ID, "'invoices'!D4", [["paid"]],
+    )